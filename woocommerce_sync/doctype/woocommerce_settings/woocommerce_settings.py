@@ -1,7 +1,6 @@
 import frappe
 from frappe.model.document import Document
 from woocommerce import API
-import json
 
 class WooCommerceSettings(Document):
     def validate(self):
@@ -11,7 +10,7 @@ class WooCommerceSettings(Document):
     def test_connection(self):
         try:
             wcapi = self.get_wcapi()
-            response = wcapi.get("products")
+            response = wcapi.get("products", params={"per_page": 1, "_fields": "id"})
             if response.status_code != 200:
                 frappe.throw("Could not connect to WooCommerce. Please check your credentials.")
         except Exception as e:
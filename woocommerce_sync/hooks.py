@@ -110,6 +110,12 @@ app_license = "MIT"
 #	}
 # }
 
+doc_events = {
+	"WooCommerce Settings": {
+		"on_update": "woocommerce_sync.woocommerce_config.clear_settings_cache"
+	}
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -141,7 +147,9 @@ app_license = "MIT"
 #
 override_whitelisted_methods = {
     "woocommerce_sync.sync_invoice.sync_invoice": "woocommerce_sync.sync_invoice.sync_invoice",
-    "woocommerce_sync.sync_invoice.get_invoice_sync_status": "woocommerce_sync.sync_invoice.get_invoice_sync_status"
+    "woocommerce_sync.sync_invoice.sync_invoices": "woocommerce_sync.sync_invoice.sync_invoices",
+    "woocommerce_sync.sync_invoice.get_invoice_sync_status": "woocommerce_sync.sync_invoice.get_invoice_sync_status",
+    "woocommerce_sync.sync_invoice.get_invoice_sync_status_bulk": "woocommerce_sync.sync_invoice.get_invoice_sync_status_bulk"
 }
 #
 # each overriding function accepts a `data` argument;
@@ -5,13 +5,32 @@ WooCommerce Sync - Logging Module
 This module provides centralized logging functionality for all WooCommerce
 synchronization operations. It creates structured log entries in the
 WooCommerce Sync Log doctype for audit trail and debugging purposes.
+
+While a sync runs (between log_sync_start and log_sync_end) entries are
+buffered and written with bulk inserts instead of one insert and commit each.
 """
 
 import frappe
 from frappe import _
 from frappe.utils import now_datetime
 import traceback
-import json
+import orjson
+from woocommerce_sync.woocommerce_config import get_sync_config
+
+
+# Columns written for every buffered log entry
+LOG_FIELDS = (
+    "name", "creation", "modified", "owner", "modified_by",
+    "log_type", "status", "message", "details", "reference_doctype",
+    "reference_name", "sync_date", "error_traceback", "woocommerce_order_id"
+)
+
+# Buffered entries written per flush during a sync
+LOG_FLUSH_SIZE = 100
+
+# Severity of each log status, compared against the Log Level setting
+LOG_LEVELS = {"Info": 20, "Warning": 30, "Error": 40}
+STATUS_LEVELS = {"Info": 20, "Success": 20, "Warning": 30, "Failed": 40}
 
 
 class WooCommerceLogger:
@@ -26,7 +45,8 @@ class WooCommerceLogger:
     - General errors and information
     
     All logs are stored in the WooCommerce Sync Log doctype for easy tracking
-    and troubleshooting.
+    and troubleshooting. During a sync they are kept in a per-request buffer
+    (frappe.local) and written by flush().
     """
     @staticmethod
     def truncate_message(message, max_length=140):
@@ -45,13 +65,41 @@ class WooCommerceLogger:
         return message
 
     @staticmethod
-    def log(log_type, status, message, details=None, reference_doctype=None, reference_name=None, error_traceback=None, woocommerce_order_id=None):
+    def format_traceback(error):
+        """
+        Format the traceback carried by an exception.
+
+        Uses the exception's own `__traceback__`, so nothing is formatted for
+        success logs or for errors passed as plain strings.
+
+        Args:
+            error (Exception/str/None): Error passed to one of the log methods
+
+        Returns:
+            str: Formatted traceback, or None when `error` is not an exception
+        """
+        if not isinstance(error, BaseException):
+            return None
+        return "".join(traceback.format_exception(type(error), error, error.__traceback__))
+
+    @staticmethod
+    def min_level():
+        """Return the configured Log Level as a number, read once per request"""
+        level = getattr(frappe.local, "woocommerce_sync_log_level", None)
+        if level is None:
+            level = LOG_LEVELS.get(get_sync_config()["log_level"], LOG_LEVELS["Info"])
+            frappe.local.woocommerce_sync_log_level = level
+        return level
+
+    @staticmethod
+    def log(log_type, status, message, details=None, reference_doctype=None, reference_name=None, error_traceback=None, woocommerce_order_id=None, level=None):
         """
         Create a log entry in the WooCommerce Sync Log doctype.
         
         This is the core logging method that all other log methods use.
         It handles message truncation and error handling to prevent
-        recursive logging errors.
+        recursive logging errors. Entries below the Log Level set in
+        WooCommerce Settings are skipped before anything is built.
         
         Args:
             log_type (str): Type of log (e.g., "Sync", "Order", "Customer", "Item")
@@ -62,8 +110,15 @@ class WooCommerceLogger:
             reference_name (str, optional): Name of the related document
             error_traceback (str, optional): Error traceback for debugging
             woocommerce_order_id (str, optional): WooCommerce order ID for reference
+            level (int, optional): Severity from LOG_LEVELS, when it differs from
+                what `status` implies (e.g. errors recorded with status "Info")
         """
         try:
+            if level is None:
+                level = STATUS_LEVELS.get(status, LOG_LEVELS["Info"])
+            if level < WooCommerceLogger.min_level():
+                return
+
             # Truncate message to prevent length exceeded errors
             truncated_message = WooCommerceLogger.truncate_message(message)
             
@@ -71,20 +126,27 @@ class WooCommerceLogger:
             if isinstance(details, str):
                 details = WooCommerceLogger.truncate_message(details)
             
-            log = frappe.get_doc({
-                "doctype": "WooCommerce Sync Log",
+            entry = {
                 "log_type": log_type,
                 "status": status,
                 "message": truncated_message,
-                "details": json.dumps(details) if details else None,
+                "details": orjson.dumps(details, default=str).decode() if details else None,
                 "reference_doctype": reference_doctype,
                 "reference_name": reference_name,
                 "sync_date": now_datetime(),
                 "error_traceback": error_traceback,
                 "woocommerce_order_id": woocommerce_order_id
-            })
-            log.insert(ignore_permissions=True)
-            frappe.db.commit()
+            }
+
+            buffer = getattr(frappe.local, "woocommerce_sync_log_buffer", None)
+            if buffer is not None:
+                buffer.append(entry)
+                return
+
+            # Committed with the rest of the request or background job
+            log = frappe.new_doc("WooCommerce Sync Log")
+            log.update(entry)
+            log.insert(ignore_permissions=True, ignore_links=True, ignore_mandatory=True)
         except Exception as e:
             # Prevent recursive error logging
             if "Error creating WooCommerce Sync Log" not in str(e):
@@ -93,25 +155,58 @@ class WooCommerceLogger:
                     "WooCommerce Logger Error"
                 )
 
+    @staticmethod
+    def flush(min_entries=0):
+        """
+        Write buffered log entries with one bulk insert and commit.
+
+        Only call this between orders: the commit also commits whatever the
+        current transaction holds.
+
+        Args:
+            min_entries (int): Skip the write while fewer entries are buffered
+        """
+        buffer = getattr(frappe.local, "woocommerce_sync_log_buffer", None)
+        if not buffer or len(buffer) < min_entries:
+            return
+
+        user = frappe.session.user
+        values = []
+        for entry in buffer:
+            timestamp = entry["sync_date"]
+            values.append([frappe.generate_hash(length=10), timestamp, timestamp, user, user]
+                          + [entry[field] for field in LOG_FIELDS[5:]])
+        buffer.clear()
+
+        try:
+            frappe.db.bulk_insert("WooCommerce Sync Log", fields=LOG_FIELDS, values=values)
+            frappe.db.commit()
+        except Exception as e:
+            frappe.log_error(
+                WooCommerceLogger.truncate_message(f"Error creating WooCommerce Sync Log: {str(e)}"),
+                "WooCommerce Logger Error"
+            )
+
     @staticmethod
     def log_sync_start():
-        """Log the start of a sync process"""
+        """Log the start of a sync process and start buffering log entries"""
+        frappe.local.woocommerce_sync_log_buffer = []
         WooCommerceLogger.log(
             log_type="Sync",
             status="Info",
-            message="Starting WooCommerce sync process",
-            details={"timestamp": str(now_datetime())}
+            message="Starting WooCommerce sync process"
         )
 
     @staticmethod
     def log_sync_end(success=True, message=None):
-        """Log the end of a sync process"""
+        """Log the end of a sync process and write out the buffered entries"""
         WooCommerceLogger.log(
             log_type="Sync",
             status="Success" if success else "Failed",
-            message=message or ("Sync completed successfully" if success else "Sync failed"),
-            details={"timestamp": str(now_datetime())}
+            message=message or ("Sync completed successfully" if success else "Sync failed")
         )
+        WooCommerceLogger.flush()
+        frappe.local.woocommerce_sync_log_buffer = None
 
     @staticmethod
     def log_customer_creation(customer_name, success=True, error=None):
@@ -124,7 +219,7 @@ class WooCommerceLogger:
             status="Success" if success else "Failed",
             message=message,
             details={"customer_name": customer_name},
-            error_traceback=traceback.format_exc() if error else None
+            error_traceback=WooCommerceLogger.format_traceback(error)
         )
 
     @staticmethod
@@ -138,7 +233,7 @@ class WooCommerceLogger:
             status="Success" if success else "Failed",
             message=message,
             details={"item_code": item_code},
-            error_traceback=traceback.format_exc() if error else None
+            error_traceback=WooCommerceLogger.format_traceback(error)
         )
 
     @staticmethod
@@ -154,7 +249,7 @@ class WooCommerceLogger:
             details={"order_id": order_id},
             reference_doctype="Sales Order" if reference_name else None,
             reference_name=reference_name,
-            error_traceback=traceback.format_exc() if error else None,
+            error_traceback=WooCommerceLogger.format_traceback(error),
             woocommerce_order_id=order_id
         )
 
@@ -168,5 +263,6 @@ class WooCommerceLogger:
             status="Info",
             message=message,
             details=details,
-            error_traceback=traceback.format_exc() if error else None
+            error_traceback=WooCommerceLogger.format_traceback(error),
+            level=LOG_LEVELS["Error"]
         ) 
\ No newline at end of file
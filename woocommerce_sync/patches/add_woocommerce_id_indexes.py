@@ -0,0 +1,13 @@
+import frappe
+
+def execute():
+    # The sync looks Sales Orders and Customers up by their WooCommerce ids
+    # once per batch; without an index each lookup scans the whole table
+    indexes = [
+        ("Sales Order", "woocommerce_order_id"),
+        ("Customer", "woocommerce_customer_id"),
+    ]
+
+    for doctype, fieldname in indexes:
+        if frappe.db.has_column(doctype, fieldname):
+            frappe.db.add_index(doctype, [fieldname])
@@ -15,21 +15,148 @@ operations between WooCommerce and ERPNext. It manages:
 import frappe
 from frappe import _
 from frappe.utils import now_datetime
-from woocommerce import API
-import json
+import orjson
+import random
+import secrets
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from woocommerce_sync.woocommerce_config import get_woocommerce_config, get_sync_config, update_sync_status
-from woocommerce_sync.logger import WooCommerceLogger
+from woocommerce_sync.logger import WooCommerceLogger, LOG_FLUSH_SIZE, LOG_LEVELS
+from woocommerce_sync.woocommerce_api import get_api_client
+
+
+ORDER_STATUSES = "pending,processing,on-hold,completed,cancelled,refunded,failed"
+
+# Top-level order fields the sync reads; everything else (addresses we don't
+# use, shipping/fee/coupon lines, links...) is left out of the response
+ORDER_FIELDS = "id,status,customer_id,billing,line_items,tax_lines,meta_data,total"
+
+# Endpoint of a single WooCommerce order
+ORDER_PATH = "orders/{}"
+
+# Order meta key recording the ERPNext invoice synced to it
+INVOICE_META_KEY = "erpnext_invoice"
+
+# All an invoice sync status check needs from the order
+INVOICE_STATUS_FIELDS = "status,meta_data"
+
+# Invoice sync status results are cached this long (seconds) to absorb UI polling
+INVOICE_STATUS_CACHE_KEY = "woocommerce_sync:invoice_status:{}"
+INVOICE_STATUS_TTL = 30
+
+# Last ETag and body seen per order, for conditional (If-None-Match) requests
+ORDER_ETAG_CACHE_KEY = "woocommerce_sync:order_etag:{}"
+ORDER_ETAG_TTL = 86400
+
+# WooCommerce caps per_page at 100
+ORDERS_PER_PAGE = 100
+
+# Number of order pages fetched in parallel
+FETCH_CONCURRENCY = 5
+
+# WooCommerce request budget, in requests per second
+REQUEST_RATE = 5
+
+# Database errors worth retrying a Sales Order status update for
+RETRYABLE_DB_ERRORS = (
+    frappe.exceptions.TimestampMismatchError,
+    frappe.exceptions.QueryDeadlockError,
+    frappe.exceptions.QueryTimeoutError,
+)
+
+# Retries for throttled or timed out WooCommerce requests (delay doubles each time)
+MAX_RETRIES = 3
+RETRY_DELAY = 1
+
+# A full sync may run this long (seconds); also the lifetime of the sync lock,
+# so a killed job cannot block later syncs for good
+SYNC_TIMEOUT = 3600
+SYNC_LOCK_KEY = "woocommerce_sync:sync_lock"
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` requests per second.
+
+    Callers that find the bucket empty reserve the next token and sleep
+    until it becomes available, so concurrent callers are spaced out
+    rather than all waking at once.
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def is_throttled(response):
+    """Return True if WooCommerce (or the host in front of it) rejected the request for rate limiting."""
+    if response.status_code == 429:
+        return True
+    if response.status_code >= 400:
+        body = response.text.lower()
+        return "rate limit" in body or "quota" in body
+    return False
 
 
 class WooCommerceSync:
     """
     Main synchronization class for WooCommerce to ERPNext integration.
     """
+    VALID_STATUSES = frozenset(ORDER_STATUSES.split(","))
+
+    # WooCommerce order status -> ERPNext Sales Order status
+    STATUS_MAP = {
+        "pending": "Draft",
+        "processing": "To Deliver and Bill",
+        "on-hold": "On Hold",
+        "completed": "Completed",
+        "cancelled": "Cancelled",
+        "refunded": "Closed",
+        "failed": "Cancelled"
+    }
+
+    ERPNEXT_STATUSES = frozenset(STATUS_MAP.values())
+
+    # (docstatus, current status) -> statuses a Sales Order may move to.
+    # Drafts may take any status; submitted orders only move forward, and
+    # anything missing here (cancelled documents included) is locked.
+    ALLOWED_TRANSITIONS = {
+        **dict.fromkeys([(0, status) for status in ERPNEXT_STATUSES], ERPNEXT_STATUSES),
+        (1, "To Deliver and Bill"): frozenset({"Completed", "Cancelled"}),
+        (1, "Completed"): frozenset({"Cancelled"})
+    }
+
     def __init__(self):
         self.config = get_woocommerce_config()
         self.sync_config = get_sync_config()
         self.validate_config()
         self.wcapi = self.get_wcapi()
+        self._rate_limiter = RateLimiter(REQUEST_RATE)
+        # SKU -> Item name, primed once per sync by load_item_map
+        self._item_map = {}
+        # Store location -> Customer name, primed once per sync by load_customer_map
+        self._customer_map = {}
+        # woocommerce_customer_id -> Customer name (None if known not to exist),
+        # primed once per sync by load_customer_map
+        self._wc_customer_map = {}
+        # Lookups whose answer does not change during a sync (tax template/account,
+        # default Customer Group/Territory), resolved on first use
+        self._defaults = {}
+        # (map, key) entries for records created by the current, uncommitted order
+        self._uncommitted = []
 
     def validate_config(self):
         if not self.config["url"] or not self.config["consumer_key"] or not self.config["consumer_secret"]:
@@ -40,7 +167,7 @@ class WooCommerceSync:
             frappe.throw(_("WooCommerce configuration is incomplete. Please check WooCommerce Settings doctype."))
 
     def get_wcapi(self):
-        return API(
+        return get_api_client(
             url=self.config["url"],
             consumer_key=self.config["consumer_key"],
             consumer_secret=self.config["consumer_secret"],
@@ -49,6 +176,50 @@ class WooCommerceSync:
             timeout=self.config["timeout"]
         )
 
+    def call_with_backoff(self, method, *args, **kwargs):
+        """
+        Call a WooCommerce API method within the request budget.
+
+        Throttled responses and timeouts are retried up to MAX_RETRIES times,
+        doubling the delay each time (or honouring Retry-After when the
+        server sends one). The last response is returned even if it is still
+        throttled so callers report it like any other API error.
+
+        Args:
+            method: Bound API method, e.g. self.wcapi.get
+            *args, **kwargs: Passed through to the method
+        """
+        delay = RETRY_DELAY
+        for attempt in range(MAX_RETRIES + 1):
+            self._rate_limiter.acquire()
+            try:
+                response = method(*args, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if attempt == MAX_RETRIES or not is_throttled(response):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+
+            time.sleep(delay)
+            delay *= 2
+
+    def log_debug(self, log_type, message, details=None):
+        """Write a step-by-step Info log, only when Debug Logging is enabled in WooCommerce Settings."""
+        if self.sync_config.get("debug_log"):
+            WooCommerceLogger.log(log_type, "Info", message, details=details)
+
+    @staticmethod
+    def _find_meta_value(wc_order, key):
+        """Return the value of the first order meta_data entry matching `key` (case-insensitive), or ""."""
+        for meta in wc_order.get("meta_data", []):
+            if (meta.get("key") or "").strip().lower() == key:
+                return meta.get("value", "")
+        return ""
+
     def get_store_location(self, wc_order):
         """
         Extract store location from WooCommerce order meta_data.
@@ -62,30 +233,19 @@ class WooCommerceSync:
         Returns:
             tuple: (store_location_value, store_location_key) or ("", "") if not found
         """
-        store_location = ""
-        store_location_key = ""
-        
-        for meta in wc_order.get("meta_data", []):
-            meta_key = (meta.get("key") or "").strip().lower()
-            
-            # Get the store location value (e.g., "Montreal")
-            if meta_key == "_selected_store_location":
-                store_location = meta.get("value", "")
-                WooCommerceLogger.log(
-                    "Order",
-                    "Info",
-                    f"Found store location: {store_location}",
-                    details={"order_id": wc_order.get("id"), "store_location": store_location}
-                )
-            
-            # Get the store location key (e.g., "store_location_1")
-            if meta_key == "_selected_store_location_key":
-                store_location_key = meta.get("value", "")
-        
-        if not store_location:
-            WooCommerceLogger.log(
+        # Store location value (e.g., "Montreal") and key (e.g., "store_location_1")
+        store_location = self._find_meta_value(wc_order, "_selected_store_location")
+        store_location_key = self._find_meta_value(wc_order, "_selected_store_location_key")
+
+        if store_location:
+            self.log_debug(
+                "Order",
+                f"Found store location: {store_location}",
+                details={"order_id": wc_order.get("id"), "store_location": store_location}
+            )
+        else:
+            self.log_debug(
                 "Order",
-                "Info",
                 f"No store location found for order {wc_order.get('id')}",
                 details={"order_id": wc_order.get("id")}
             )
@@ -99,28 +259,34 @@ class WooCommerceSync:
 
         WooCommerceLogger.log_sync_start()
         try:
-            response = self.wcapi.get("orders", params={
-                "status": "pending,processing,on-hold,completed,cancelled,refunded,failed"
-            })
-            
-            orders = self.validate_api_response(response, "fetch orders")
+            orders = self.fetch_orders()
             WooCommerceLogger.log(
                 "Sync",
                 "Info",
                 f"Found {len(orders)} orders to sync",
                 details={"order_count": len(orders)}
             )
-            
+
+            existing_orders = self.load_existing_orders(orders)
+            self.load_customer_map(orders)
+            self.load_item_map(self._collect_skus(orders))
+
             successful_syncs = 0
             failed_syncs = 0
             skipped_orders = []
 
+            # Each order is one transaction: everything it created (customer,
+            # items, Sales Order) is committed together or rolled back together
             for order in orders:
                 try:
                     self.validate_woocommerce_order(order)
-                    self.create_erpnext_order(order)
+                    self.create_erpnext_order(order, existing_orders)
+                    frappe.db.commit()
+                    self._uncommitted = []
                     successful_syncs += 1
                 except Exception as e:
+                    frappe.db.rollback()
+                    self.forget_uncommitted()
                     failed_syncs += 1
                     error_details = {
                         "order_id": order.get("id", "unknown"),
@@ -135,10 +301,14 @@ class WooCommerceSync:
                         "Order",
                         "Info",
                         f"Failed to sync order {order.get('id', 'unknown')}: {str(e)}",
-                        details=error_details
+                        details=error_details,
+                        level=LOG_LEVELS["Error"]
                     )
                     skipped_orders.append(error_details)
 
+                # Safe point: the order's transaction has just been closed
+                WooCommerceLogger.flush(min_entries=LOG_FLUSH_SIZE)
+
             self.sync_config["last_sync"] = now_datetime()
             self.sync_config["sync_status"] = "Partial Success" if failed_syncs > 0 else "Success"
             self.save_sync_status()
@@ -162,6 +332,58 @@ class WooCommerceSync:
             WooCommerceLogger.log_sync_end(False, str(e))
             WooCommerceLogger.log_error("WooCommerce Sync Error", e)
 
+    def remember_created(self, cache, key, name):
+        """Cache a newly created record, to be forgotten again if its order is rolled back."""
+        cache[key] = name
+        self._uncommitted.append((cache, key))
+
+    def forget_uncommitted(self):
+        """Drop cached records created by an order that was rolled back."""
+        for cache, key in self._uncommitted:
+            cache.pop(key, None)
+        self._uncommitted = []
+        # The default Customer Group/Territory may have been created by that order too
+        self._defaults.pop("customer_defaults", None)
+
+    def fetch_orders(self):
+        """
+        Fetch all orders with a supported status from WooCommerce.
+
+        The first page tells us how many pages there are (X-WP-TotalPages);
+        the remaining pages are requested concurrently. Only the HTTP calls
+        run in worker threads - responses are validated (and logged) here,
+        since Frappe's request context is not available to other threads.
+
+        Returns:
+            list: WooCommerce order dictionaries
+        """
+        def get_page(page):
+            return self.call_with_backoff(self.wcapi.get, "orders", params={
+                "status": ORDER_STATUSES,
+                "_fields": ORDER_FIELDS,
+                "per_page": ORDERS_PER_PAGE,
+                "page": page
+            })
+
+        response = get_page(1)
+        orders = self.validate_api_response(response, "fetch orders")
+
+        total_pages = int(response.headers.get("X-WP-TotalPages") or 1)
+        if total_pages > 1:
+            pages = range(2, total_pages + 1)
+            with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as executor:
+                for page, page_response in zip(pages, executor.map(get_page, pages)):
+                    orders.extend(self.validate_api_response(page_response, f"fetch orders (page {page})"))
+
+            # Orders placed while paging shift later pages, so an order can
+            # come back twice; it must not become two Sales Orders
+            unique_orders = {}
+            for order in orders:
+                unique_orders.setdefault(order.get("id") or id(order), order)
+            orders = list(unique_orders.values())
+
+        return orders
+
     def validate_api_response(self, response, operation="fetch orders"):
         if response.status_code != 200:
             error_msg = f"WooCommerce API error during {operation}: {response.status_code} - {response.text}"
@@ -173,13 +395,13 @@ class WooCommerceSync:
             raise ValueError(error_msg)
         
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             if not isinstance(data, list):
                 error_msg = f"Unexpected response format during {operation}: expected list, got {type(data)}"
                 WooCommerceLogger.log_error(error_msg, details={"response_type": str(type(data))})
                 raise ValueError(error_msg)
             return data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             error_msg = f"Invalid JSON response during {operation}: {str(e)}"
             WooCommerceLogger.log_error(error_msg, details={"response_text": response.text})
             raise ValueError(error_msg)
@@ -207,8 +429,7 @@ class WooCommerceSync:
                 if price is None or price == "" or (isinstance(price, (int, float)) and str(price).lower() == "nan"):
                     errors.append(f"Line item {i+1} has no price")
         
-        valid_statuses = ["pending", "processing", "on-hold", "completed", "cancelled", "refunded", "failed"]
-        if wc_order.get("status") not in valid_statuses:
+        if wc_order.get("status") not in self.VALID_STATUSES:
             errors.append(f"Invalid order status: {wc_order.get('status')}")
         
         if errors:
@@ -224,137 +445,192 @@ class WooCommerceSync:
                 
                 order_doc.status = new_status
                 order_doc.save()
-                frappe.db.commit()
                 return True, f"Successfully updated on attempt {attempt + 1}"
                 
-            except Exception as e:
+            except RETRYABLE_DB_ERRORS as e:
                 if attempt < max_retries - 1:
+                    # Exponential backoff with jitter: ~0.1s, ~0.2s, ... capped at 2s
+                    delay = min(2.0, 0.1 * 2 ** attempt + random.uniform(0, 0.1))
                     WooCommerceLogger.log("Order", "Info", f"Update attempt {attempt + 1} failed, retrying: {str(e)}", details={
                         "order_name": order_doc.name,
                         "attempt": attempt + 1,
+                        "retry_delay": round(delay, 3),
                         "error": str(e)
                     })
                     frappe.db.rollback()
-                    import time
-                    time.sleep(1)
+                    time.sleep(delay)
                 else:
                     return False, f"Failed after {max_retries} attempts: {str(e)}"
+
+            except Exception as e:
+                # Not a conflict - retrying would fail the same way
+                return False, f"Failed on attempt {attempt + 1}: {str(e)}"
         
         return False, "Max retries exceeded"
 
     def can_update_order_status(self, order_doc, new_status):
+        """
+        Check whether a Sales Order may move to `new_status`.
+
+        Args:
+            order_doc: Sales Order document or row with `status` and `docstatus`
+            new_status (str): Target ERPNext status
+        """
         if order_doc.status == new_status:
             return False, "Order already in target status"
-        
-        if order_doc.docstatus == 1:
-            allowed_transitions = {
-                "To Deliver and Bill": ["Completed", "Cancelled"],
-                "Completed": ["Cancelled"],
-                "Cancelled": []
-            }
-            current_status = order_doc.status
-            if current_status in allowed_transitions and new_status in allowed_transitions[current_status]:
-                return True, "Valid status transition"
-            else:
-                return False, f"Invalid status transition from {current_status} to {new_status}"
-        
-        elif order_doc.docstatus == 0:
-            return True, "Draft order can be updated"
-        
-        else:
-            return False, "Cancelled order cannot be updated"
-    
+
+        allowed = self.ALLOWED_TRANSITIONS.get((order_doc.docstatus, order_doc.status), ())
+        if new_status in allowed:
+            return True, "Valid status transition"
+        return False, f"Invalid status transition from {order_doc.status} to {new_status}"
+
     def get_erpnext_status(self, wc_status):
-        status_mapping = {
-            "pending": "Draft",
-            "processing": "To Deliver and Bill",
-            "on-hold": "On Hold",
-            "completed": "Completed",
-            "cancelled": "Cancelled",
-            "refunded": "Closed",
-            "failed": "Cancelled"
+        return self.STATUS_MAP.get(wc_status, "Draft")
+
+    def load_existing_orders(self, orders):
+        """
+        Look up the Sales Orders already created for a batch of WooCommerce orders.
+
+        Returns:
+            dict: woocommerce_order_id -> row with name, status and docstatus
+        """
+        order_ids = [str(order["id"]) for order in orders if order.get("id")]
+        if not order_ids:
+            return {}
+        return {
+            row.woocommerce_order_id: row
+            for row in frappe.get_all(
+                "Sales Order",
+                filters={"woocommerce_order_id": ["in", order_ids]},
+                fields=["name", "woocommerce_order_id", "status", "docstatus"]
+            )
         }
-        return status_mapping.get(wc_status, "Draft")
 
-    def create_erpnext_order(self, wc_order):
+    def load_customer_map(self, orders):
+        """
+        Resolve existing Customers for a batch of orders.
+
+        One query matches store locations against customer names, a second
+        matches WooCommerce customer ids against woocommerce_customer_id.
+        """
+        store_locations = set()
+        wc_customer_ids = set()
+        for order in orders:
+            store_location = (self._find_meta_value(order, "_selected_store_location") or "").strip()
+            if store_location:
+                store_locations.add(store_location)
+            if order.get("customer_id"):
+                wc_customer_ids.add(str(order["customer_id"]))
+
+        if store_locations:
+            for customer in frappe.get_all(
+                "Customer",
+                filters={"customer_name": ["in", list(store_locations)]},
+                fields=["name", "customer_name"]
+            ):
+                self._customer_map.setdefault(customer.customer_name, customer.name)
+
+        if wc_customer_ids:
+            self._wc_customer_map.update(dict.fromkeys(wc_customer_ids))
+            for customer in frappe.get_all(
+                "Customer",
+                filters={"woocommerce_customer_id": ["in", list(wc_customer_ids)]},
+                fields=["name", "woocommerce_customer_id"]
+            ):
+                self._wc_customer_map[customer.woocommerce_customer_id] = customer.name
+
+    def create_erpnext_order(self, wc_order, existing_orders=None):
         """
         Create or update a Sales Order in ERPNext from a WooCommerce order.
         Includes store location sync from WooCommerce checkout.
+
+        Args:
+            wc_order (dict): WooCommerce order data
+            existing_orders (dict, optional): Prefetched result of load_existing_orders;
+                the Sales Order is looked up individually when not given
         """
         try:
-            WooCommerceLogger.log("Order", "Info", f"Starting order sync for WooCommerce order {wc_order.get('id')}")
-            
-            WooCommerceLogger.log("Order", "Info", "Order validation passed", details={"order_id": wc_order.get("id")})
+            self.log_debug("Order", f"Starting order sync for WooCommerce order {wc_order.get('id')}")
 
             # Extract store location from WooCommerce order (used to determine customer)
             store_location, store_location_key = self.get_store_location(wc_order)
-            WooCommerceLogger.log(
-                "Order",
-                "Info",
-                f"Store location extracted: '{store_location}' (key: {store_location_key})",
-                details={"order_id": wc_order.get("id"), "store_location": store_location}
-            )
 
             # Check if order already exists
-            existing_order = frappe.get_all(
-                "Sales Order",
-                filters={"woocommerce_order_id": str(wc_order["id"])},
-                fields=["name"]
-            )
+            if existing_orders is None:
+                existing_orders = self.load_existing_orders([wc_order])
+            existing_order = existing_orders.get(str(wc_order["id"]))
 
             if existing_order:
-                WooCommerceLogger.log("Order", "Info", f"Order {wc_order['id']} already exists. Checking for status update.")
-                try:
-                    existing_order_doc = frappe.get_doc("Sales Order", existing_order[0]["name"])
-                    new_status = self.get_erpnext_status(wc_order["status"])
+                new_status = self.get_erpnext_status(wc_order["status"])
+                # Nothing to update - skip loading the document entirely
+                if existing_order["status"] == new_status:
+                    return
 
-                    can_update, reason = self.can_update_order_status(existing_order_doc, new_status)
+                self.log_debug("Order", f"Order {wc_order['id']} already exists. Checking for status update.")
+                try:
+                    # The prefetched row (name, status, docstatus) is enough to decide;
+                    # the full document is only loaded when it will be saved
+                    can_update, reason = self.can_update_order_status(existing_order, new_status)
                     
                     if can_update:
-                        WooCommerceLogger.log("Order", "Info", f"Updating order {existing_order_doc.name} status from {existing_order_doc.status} to {new_status}")
+                        self.log_debug("Order", f"Updating order {existing_order.name} status from {existing_order.status} to {new_status}")
+                        existing_order_doc = frappe.get_doc("Sales Order", existing_order.name)
                         success, message = self.update_order_with_retry(existing_order_doc, new_status)
                         
                         if success:
-                            WooCommerceLogger.log("Order", "Success", f"Updated existing order status: {message}", details={
-                                "order_id": wc_order["id"], 
-                                "old_status": existing_order_doc.status, 
-                                "new_status": new_status,
-                                "store_location": store_location
-                            })
+                            WooCommerceLogger.log(
+                                "Order",
+                                "Success",
+                                f"Updated existing order status: {message}",
+                                details={
+                                    "order_id": wc_order["id"],
+                                    "old_status": existing_order.status,
+                                    "new_status": new_status,
+                                    "store_location": store_location
+                                },
+                                reference_doctype="Sales Order",
+                                reference_name=existing_order.name,
+                                woocommerce_order_id=wc_order["id"]
+                            )
                         else:
                             raise ValueError(f"Failed to update order status: {message}")
                     else:
-                        WooCommerceLogger.log("Order", "Info", f"Order {wc_order['id']} cannot be updated: {reason}", details={
+                        # Same outcome on every re-sync until the order changes - not worth a log entry by default
+                        self.log_debug("Order", f"Order {wc_order['id']} cannot be updated: {reason}", details={
                             "order_id": wc_order["id"], 
-                            "current_status": existing_order_doc.status,
+                            "current_status": existing_order.status,
                             "target_status": new_status,
-                            "docstatus": existing_order_doc.docstatus,
+                            "docstatus": existing_order.docstatus,
                             "reason": reason
                         })
-                    
-                    WooCommerceLogger.log_order_creation(wc_order["id"], True, reference_name=existing_order_doc.name)
                     return
                     
                 except Exception as e:
                     error_msg = f"Failed to update existing order {wc_order['id']}: {str(e)}"
                     WooCommerceLogger.log("Order", "Info", error_msg, details={
                         "order_id": wc_order["id"],
-                        "existing_order_name": existing_order[0]["name"],
+                        "existing_order_name": existing_order["name"],
                         "error": str(e)
-                    })
+                    }, level=LOG_LEVELS["Error"])
                     raise ValueError(error_msg)
 
+            # Collected while building the order and written as a single log entry
+            log_ctx = {
+                "woocommerce_order_id": wc_order["id"],
+                "store_location": store_location,
+                "store_location_key": store_location_key
+            }
+
             # Get or create customer (based on WooCommerce customer_id and store location)
-            WooCommerceLogger.log("Order", "Info", f"Getting or creating customer for order {wc_order['id']}")
             try:
                 customer = self.get_or_create_customer(wc_order, store_location=store_location)
             except Exception as e:
                 raise ValueError(f"Failed to create/get customer: {str(e)}")
 
-            WooCommerceLogger.log("Order", "Info", f"Customer obtained: {customer}")
+            log_ctx["customer"] = customer
+            self.log_debug("Order", f"Customer obtained: {customer}", details=log_ctx)
 
             # Get order items
-            WooCommerceLogger.log("Order", "Info", f"Getting order items for WooCommerce order {wc_order['id']}")
             try:
                 items = self.get_order_items(wc_order)
                 if not items:
@@ -362,55 +638,47 @@ class WooCommerceSync:
             except Exception as e:
                 raise ValueError(f"Failed to process order items: {str(e)}")
 
-            WooCommerceLogger.log("Order", "Info", f"Order items retrieved", details={"item_count": len(items)})
+            log_ctx["item_count"] = len(items)
+            self.log_debug("Order", "Order items retrieved", details=log_ctx)
 
             # Get taxes
             tax_template = self.get_tax_template()
             tax_details = self.get_tax_details(wc_order)
 
-            WooCommerceLogger.log("Order", "Info", "Tax info retrieved", details={"tax_template": tax_template, "tax_details": tax_details})
+            log_ctx["tax_template"] = tax_template
+            log_ctx["tax_count"] = len(tax_details)
+            self.log_debug("Order", "Tax info retrieved", details={"tax_template": tax_template, "tax_details": tax_details})
 
             # Create Sales Order for resolved customer
-            WooCommerceLogger.log("Order", "Info", f"Creating Sales Order document for WooCommerce order {wc_order['id']}")
-            
-            sales_order_data = {
-                "doctype": "Sales Order",
-                "customer": customer,
-                "delivery_date": frappe.utils.today(),
-                "woocommerce_order_id": str(wc_order["id"]),
-                "items": items,
-                "taxes_and_charges": tax_template,
-                "taxes": tax_details,
-                "status": self.get_erpnext_status(wc_order["status"])
-            }
-            
-            sales_order = frappe.get_doc(sales_order_data)
-
-            WooCommerceLogger.log("Order", "Info", f"Inserting Sales Order document for {wc_order['id']}")
-            sales_order.insert()
 
+            sales_order = frappe.new_doc("Sales Order")
+            sales_order.customer = customer
+            sales_order.delivery_date = frappe.utils.today()
+            sales_order.woocommerce_order_id = str(wc_order["id"])
+            for item in items:
+                sales_order.append("items", item)
+            sales_order.taxes_and_charges = tax_template
+            for tax in tax_details:
+                sales_order.append("taxes", tax)
+            sales_order.status = self.get_erpnext_status(wc_order["status"])
+
+            # Orders that end up submitted are inserted with docstatus 1, so Frappe
+            # runs validate/before_submit/on_submit and writes the row once
+            # instead of inserting a draft and updating it on submit
             if sales_order.status not in ["Draft", "Cancelled"]:
-                WooCommerceLogger.log("Order", "Info", f"Submitting Sales Order {sales_order.name}")
-                sales_order.submit()
-
-            frappe.db.commit()
+                sales_order.docstatus = 1
+            sales_order.insert()
 
-            WooCommerceLogger.log_order_creation(
-                wc_order["id"],
-                True,
-                reference_name=sales_order.name
-            )
-            
+            log_ctx["erpnext_order"] = sales_order.name
+            log_ctx["status"] = sales_order.status
             WooCommerceLogger.log(
                 "Order",
                 "Success",
                 f"Sales Order {sales_order.name} created successfully",
-                details={
-                    "woocommerce_order_id": wc_order["id"],
-                    "erpnext_order": sales_order.name,
-                    "customer": customer,
-                    "status": sales_order.status
-                }
+                details=log_ctx,
+                reference_doctype="Sales Order",
+                reference_name=sales_order.name,
+                woocommerce_order_id=wc_order["id"]
             )
 
         except Exception as e:
@@ -425,6 +693,8 @@ class WooCommerceSync:
             # Primary behavior: always treat the selected store location as the customer
             if store_location:
                 store_location_name = store_location.strip()
+                if store_location_name in self._customer_map:
+                    return self._customer_map[store_location_name]
                 if store_location_name:
                     WooCommerceLogger.log(
                         "Customer",
@@ -433,7 +703,7 @@ class WooCommerceSync:
                         details={
                             "store_location": store_location_name,
                             "woocommerce_customer_id": woocommerce_customer_id,
-                            "wc_order": wc_order,
+                            "order_id": wc_order.get("id"),
                         },
                     )
 
@@ -450,6 +720,7 @@ class WooCommerceSync:
                             f"Found existing customer for store location: {existing_customer[0]['name']}",
                             details={"store_location": store_location_name},
                         )
+                        self._customer_map[store_location_name] = existing_customer[0]["name"]
                         return existing_customer[0]["name"]
 
                     WooCommerceLogger.log(
@@ -459,28 +730,17 @@ class WooCommerceSync:
                         details={"store_location": store_location_name},
                     )
 
+            # Without a store location, reuse the customer created for this WooCommerce customer before
+            elif woocommerce_customer_id:
+                key = str(woocommerce_customer_id)
+                if key not in self._wc_customer_map:
+                    self._wc_customer_map[key] = frappe.db.get_value(
+                        "Customer", {"woocommerce_customer_id": key}, "name"
+                    )
+                if self._wc_customer_map[key]:
+                    return self._wc_customer_map[key]
 
-            customer_group = "All Customer Groups"
-            if not frappe.db.exists("Customer Group", customer_group):
-                customer_group_doc = frappe.get_doc({
-                    "doctype": "Customer Group",
-                    "customer_group_name": customer_group,
-                    "parent_customer_group": "All Customer Groups",
-                    "is_group": 0
-                })
-                customer_group_doc.insert(ignore_permissions=True)
-                frappe.db.commit()
-
-            territory = "All Territories"
-            if not frappe.db.exists("Territory", territory):
-                territory_doc = frappe.get_doc({
-                    "doctype": "Territory",
-                    "territory_name": territory,
-                    "parent_territory": "All Territories",
-                    "is_group": 0
-                })
-                territory_doc.insert(ignore_permissions=True)
-                frappe.db.commit()
+            customer_group, territory = self.get_customer_defaults()
 
             # Determine customer name:
             # 1. Prefer the selected store location from WooCommerce checkout
@@ -500,10 +760,10 @@ class WooCommerceSync:
                 customer_name = ""
 
             if not customer_name:
-                customer_name = f"WooCommerce Customer {frappe.generate_hash(length=4)}"
+                customer_name = f"WooCommerce Customer {secrets.token_hex(2)}"
 
-            customer_data = {
-                "doctype": "Customer",
+            customer = frappe.new_doc("Customer")
+            customer.update({
                 "customer_name": customer_name,
                 "customer_type": "Individual",
                 "customer_group": customer_group,
@@ -515,13 +775,16 @@ class WooCommerceSync:
                 "state": wc_order["billing"].get("state", ""),
                 "pincode": wc_order["billing"].get("postcode", ""),
                 "country": wc_order["billing"].get("country", "")
-            }
+            })
             if woocommerce_customer_id:
-                customer_data["woocommerce_customer_id"] = str(woocommerce_customer_id)
+                customer.woocommerce_customer_id = str(woocommerce_customer_id)
 
-            customer = frappe.get_doc(customer_data)
             customer.insert(ignore_permissions=True)
-            frappe.db.commit()
+
+            if store_location:
+                self.remember_created(self._customer_map, customer_name, customer.name)
+            if woocommerce_customer_id:
+                self.remember_created(self._wc_customer_map, str(woocommerce_customer_id), customer.name)
 
             WooCommerceLogger.log_customer_creation(customer_name, True)
             return customer.name
@@ -534,6 +797,39 @@ class WooCommerceSync:
             )
             raise
 
+    def get_customer_defaults(self):
+        """
+        Return the Customer Group and Territory for new customers, creating them if missing.
+
+        Checked once per sync; later calls reuse the result.
+
+        Returns:
+            tuple: (customer_group, territory)
+        """
+        if "customer_defaults" not in self._defaults:
+            customer_group = "All Customer Groups"
+            if not frappe.db.exists("Customer Group", customer_group):
+                customer_group_doc = frappe.get_doc({
+                    "doctype": "Customer Group",
+                    "customer_group_name": customer_group,
+                    "parent_customer_group": "All Customer Groups",
+                    "is_group": 0
+                })
+                customer_group_doc.insert(ignore_permissions=True)
+
+            territory = "All Territories"
+            if not frappe.db.exists("Territory", territory):
+                territory_doc = frappe.get_doc({
+                    "doctype": "Territory",
+                    "territory_name": territory,
+                    "parent_territory": "All Territories",
+                    "is_group": 0
+                })
+                territory_doc.insert(ignore_permissions=True)
+
+            self._defaults["customer_defaults"] = (customer_group, territory)
+        return self._defaults["customer_defaults"]
+
     def get_order_items(self, wc_order):
         items = []
         for item in wc_order["line_items"]:
@@ -547,60 +843,91 @@ class WooCommerceSync:
             })
         return items
 
-    def get_or_create_item(self, wc_item):
-        try:
-            WooCommerceLogger.log(
-                "Item",
-                "Info",
-                f"Checking for existing item by name'",
-                details={"item_code": wc_item}
-            )
-            item_code = wc_item.get("sku")
+    def get_item_sku(self, wc_item):
+        """
+        Resolve the SKU for a WooCommerce line item.
 
-            if not item_code:
-                for meta in wc_item.get("meta_data", []):
-                    key = meta.get("key", "").strip().lower()
-                    display_key = meta.get("display_key", "").strip().lower()
-                    if key == "sku" or display_key == "sku":
-                        item_code = meta.get("value")
-                        break
+        Checks the line item's own `sku`, then a "sku" entry in its meta_data,
+        then the YITH add-ons `_ywapo_meta_data` block.
 
-            if not item_code:
-                for meta in wc_item.get("meta_data", []):
-                    if meta.get("key") == "_ywapo_meta_data":
-                        for entry in meta.get("value", []):
-                            for subkey, subval in entry.items():
-                                if isinstance(subval, dict):
-                                    label = subval.get("display_label", "").strip().lower()
-                                    if label == "sku":
-                                        item_code = subval.get("addon_value")
-                                        break
-                            if item_code:
-                                break
-                    if item_code:
+        Returns:
+            str: The SKU, or None if the line item carries none
+        """
+        item_code = wc_item.get("sku")
+
+        if not item_code:
+            # Single pass over meta_data: a "sku" entry wins, the first add-on
+            # SKU found along the way is kept as the fallback
+            meta_sku = addon_sku = None
+            for meta in wc_item.get("meta_data") or ():
+                key = (meta.get("key") or "").strip().lower()
+                if key == "sku" or (meta.get("display_key") or "").strip().lower() == "sku":
+                    meta_sku = meta.get("value")
+                    if meta_sku:
                         break
+                elif key == "_ywapo_meta_data" and not addon_sku:
+                    addon_sku = next(
+                        (
+                            subval.get("addon_value")
+                            for entry in meta.get("value") or ()
+                            for subval in entry.values()
+                            if isinstance(subval, dict)
+                            and (subval.get("display_label") or "").strip().lower() == "sku"
+                        ),
+                        None
+                    )
+            item_code = meta_sku or addon_sku
+
+        return item_code.strip() if item_code else None
+
+    def _collect_skus(self, orders):
+        """Return the set of SKUs referenced by the line items of all orders."""
+        skus = set()
+        for order in orders:
+            for wc_item in order.get("line_items") or []:
+                sku = self.get_item_sku(wc_item)
+                if sku:
+                    skus.add(sku)
+        return skus
+
+    def load_item_map(self, skus):
+        """
+        Resolve existing Items for a batch of SKUs with a single query.
+
+        The result is kept on the instance so get_or_create_item can skip
+        its per-line-item lookup.
+        """
+        if not skus:
+            return
+        for item in frappe.get_all(
+            "Item",
+            filters={"item_code": ["in", list(skus)]},
+            fields=["item_code", "name"]
+        ):
+            self._item_map[item.item_code] = item.name
+
+    def get_or_create_item(self, wc_item):
+        try:
+            item_code = self.get_item_sku(wc_item)
+
+            if item_code and item_code in self._item_map:
+                return self._item_map[item_code]
 
             if not item_code:
                 item_code = frappe.scrub(wc_item["name"])[:20]
-                item_code = f"{item_code}-{frappe.generate_hash(length=4)}"
+                item_code = f"{item_code}-{secrets.token_hex(2)}"
 
             WooCommerceLogger.log(
                 "Item",
                 "Info",
-                f"Checking for existing item by name: '{item_code.strip()}'",
-                details={"item_code": item_code.strip()}
+                f"Checking for existing item by name: '{item_code}'",
+                details={"item_code": item_code}
             )
             existing_item = frappe.get_all(
                 "Item",
-                filters={"name": item_code.strip()},
+                filters={"name": item_code},
                 fields=["name"]
             )
-            WooCommerceLogger.log(
-                "Item",
-                "Info",
-                f"Existing item lookup result for '{item_code.strip()}': {existing_item}",
-                details={"item_code": item_code.strip(), "existing_item": existing_item}
-            )
 
             if existing_item:
                 WooCommerceLogger.log(
@@ -609,10 +936,11 @@ class WooCommerceSync:
                     f"Found existing item: {existing_item[0]['name']}",
                     details={"item_code": item_code}
                 )
+                self._item_map[item_code] = existing_item[0]["name"]
                 return existing_item[0]["name"]
 
-            item = frappe.get_doc({
-                "doctype": "Item",
+            item = frappe.new_doc("Item")
+            item.update({
                 "item_code": item_code,
                 "item_name": wc_item["name"][:140],
                 "description": wc_item.get("description", "")[:1000],
@@ -624,9 +952,9 @@ class WooCommerceSync:
                 "is_purchase_item": 1
             })
 
-            item.insert()
-            frappe.db.commit()
+            item.insert(ignore_permissions=True)
 
+            self.remember_created(self._item_map, item_code, item.name)
             WooCommerceLogger.log_item_creation(item.item_code, True)
             return item.name
 
@@ -635,7 +963,9 @@ class WooCommerceSync:
             raise
 
     def get_tax_template(self):
-        return frappe.get_value("Tax Template", {"is_default": 1}, "name")
+        if "tax_template" not in self._defaults:
+            self._defaults["tax_template"] = frappe.get_value("Tax Template", {"is_default": 1}, "name")
+        return self._defaults["tax_template"]
 
     def get_tax_details(self, wc_order):
         tax_details = []
@@ -650,7 +980,9 @@ class WooCommerceSync:
         return tax_details
 
     def get_tax_account(self):
-        return frappe.get_value("Account", {"is_default": 1, "account_type": "Tax"}, "name")
+        if "tax_account" not in self._defaults:
+            self._defaults["tax_account"] = frappe.get_value("Account", {"is_default": 1, "account_type": "Tax"}, "name")
+        return self._defaults["tax_account"]
 
     def save_sync_status(self):
         try:
@@ -661,7 +993,9 @@ class WooCommerceSync:
         except Exception as e:
             WooCommerceLogger.log_error("Failed to save sync status", e)
 
-    def get_sync_status(self):
+    @staticmethod
+    def get_sync_status():
+        """Read the last sync result from the cached settings; needs no API client"""
         try:
             sync_config = get_sync_config()
             return {
@@ -677,33 +1011,63 @@ class WooCommerceSync:
                 "enable_sync": False
             }
 
+    @staticmethod
+    def build_invoice_update(invoice_name):
+        """Order changes that mark a WooCommerce order as invoiced by `invoice_name`"""
+        return {
+            "status": "completed",
+            "meta_data": [
+                {
+                    "key": INVOICE_META_KEY,
+                    "value": invoice_name
+                }
+            ]
+        }
+
+    def load_invoice_orders(self, invoice_names):
+        """
+        Resolve the Sales Order and WooCommerce order linked to each invoice.
+
+        Returns:
+            dict: invoice name -> (sales_order, woocommerce_order_id); either may be None
+        """
+        invoices = frappe.get_all(
+            "Sales Invoice",
+            filters={"name": ["in", invoice_names]},
+            fields=["name", "sales_order"]
+        )
+        sales_orders = list({invoice.sales_order for invoice in invoices if invoice.sales_order})
+        order_ids = dict(frappe.get_all(
+            "Sales Order",
+            filters={"name": ["in", sales_orders]},
+            fields=["name", "woocommerce_order_id"],
+            as_list=True
+        )) if sales_orders else {}
+        return {
+            invoice.name: (invoice.sales_order, order_ids.get(invoice.sales_order) or None)
+            for invoice in invoices
+        }
+
     def sync_invoice_to_woocommerce(self, invoice_name):
         try:
-            invoice = frappe.get_doc("Sales Invoice", invoice_name)
-            
+            sales_order = frappe.db.get_value("Sales Invoice", invoice_name, "sales_order")
+
             woocommerce_order_id = None
-            if invoice.sales_order:
-                sales_order = frappe.get_doc("Sales Order", invoice.sales_order)
-                woocommerce_order_id = sales_order.woocommerce_order_id
+            if sales_order:
+                woocommerce_order_id = frappe.db.get_value("Sales Order", sales_order, "woocommerce_order_id")
 
             if not woocommerce_order_id:
                 raise ValueError("No WooCommerce order ID found for this invoice")
 
-            invoice_data = {
-                "status": "completed",
-                "meta_data": [
-                    {
-                        "key": "erpnext_invoice",
-                        "value": invoice_name
-                    }
-                ]
-            }
+            invoice_data = self.build_invoice_update(invoice_name)
 
-            response = self.wcapi.put(f"orders/{woocommerce_order_id}", invoice_data)
+            response = self.call_with_backoff(self.wcapi.put, ORDER_PATH.format(woocommerce_order_id), invoice_data)
             
             if response.status_code not in [200, 201]:
                 raise ValueError(f"Failed to update WooCommerce order: {response.text}")
 
+            frappe.cache().delete_value(INVOICE_STATUS_CACHE_KEY.format(invoice_name))
+
             WooCommerceLogger.log(
                 "Invoice",
                 "Success",
@@ -711,7 +1075,7 @@ class WooCommerceSync:
                 details={
                     "invoice": invoice_name,
                     "woocommerce_order": woocommerce_order_id,
-                    "response": response.json()
+                    "response": orjson.loads(response.content)
                 }
             )
 
@@ -729,48 +1093,243 @@ class WooCommerceSync:
                 details={
                     "invoice": invoice_name,
                     "error": str(e)
-                }
+                },
+                level=LOG_LEVELS["Error"]
             )
             raise
 
+    def sync_invoices_to_woocommerce(self, invoice_names):
+        """
+        Sync several Sales Invoices to WooCommerce through the orders/batch endpoint.
+
+        Each request updates up to ORDERS_PER_PAGE orders (WooCommerce's batch
+        limit), instead of one PUT per invoice.
+
+        Args:
+            invoice_names (list): Names of the ERPNext Sales Invoices to sync
+
+        Returns:
+            dict: invoice name -> status dictionary like sync_invoice_to_woocommerce's
+        """
+        results = {}
+        invoice_orders = self.load_invoice_orders(invoice_names)
+
+        pending = []
+        for invoice_name in invoice_names:
+            woocommerce_order_id = invoice_orders.get(invoice_name, (None, None))[1]
+            if woocommerce_order_id:
+                pending.append((invoice_name, woocommerce_order_id))
+            else:
+                results[invoice_name] = {
+                    "status": "Failed",
+                    "message": "No WooCommerce order ID found for this invoice"
+                }
+
+        for start in range(0, len(pending), ORDERS_PER_PAGE):
+            chunk = pending[start:start + ORDERS_PER_PAGE]
+            try:
+                response = self.call_with_backoff(self.wcapi.post, "orders/batch", {
+                    "update": [
+                        {"id": int(order_id), **self.build_invoice_update(invoice_name)}
+                        for invoice_name, order_id in chunk
+                    ]
+                })
+                if response.status_code not in [200, 201]:
+                    raise ValueError(f"Failed to update WooCommerce orders: {response.text}")
+
+                # Match entries by order id; failed ones carry an "error" object
+                invoices_by_order = {}
+                for invoice_name, order_id in chunk:
+                    invoices_by_order.setdefault(str(order_id), []).append(invoice_name)
+
+                for order_data in orjson.loads(response.content).get("update", []):
+                    for invoice_name in invoices_by_order.get(str(order_data.get("id")), []):
+                        if order_data.get("error"):
+                            results[invoice_name] = {
+                                "status": "Failed",
+                                "message": order_data["error"].get("message") or "WooCommerce rejected the update"
+                            }
+                            continue
+
+                        frappe.cache().delete_value(INVOICE_STATUS_CACHE_KEY.format(invoice_name))
+                        results[invoice_name] = {
+                            "status": "success",
+                            "message": f"Invoice {invoice_name} synced to WooCommerce successfully",
+                            "woocommerce_order_id": str(order_data["id"])
+                        }
+
+            except Exception as e:
+                for invoice_name, order_id in chunk:
+                    results.setdefault(invoice_name, {"status": "Failed", "message": str(e)})
+
+            for invoice_name, order_id in chunk:
+                results.setdefault(invoice_name, {
+                    "status": "Failed",
+                    "message": f"WooCommerce did not return order {order_id} in the batch response"
+                })
+
+        synced = [name for name, result in results.items() if result["status"] == "success"]
+        all_synced = len(synced) == len(invoice_names)
+        WooCommerceLogger.log(
+            "Invoice",
+            "Success" if all_synced else "Info",
+            f"Synced {len(synced)} of {len(invoice_names)} invoices to WooCommerce",
+            details={
+                "synced": synced,
+                "failed": {name: result["message"] for name, result in results.items() if result["status"] != "success"}
+            },
+            level=None if all_synced else LOG_LEVELS["Error"]
+        )
+        return results
+
     def get_invoice_sync_status(self, invoice_name):
+        cache_key = INVOICE_STATUS_CACHE_KEY.format(invoice_name)
+        cached = frappe.cache().get_value(cache_key)
+        if cached:
+            return cached
+
         try:
-            invoice = frappe.get_doc("Sales Invoice", invoice_name)
-            if not invoice.sales_order:
+            sales_order = frappe.db.get_value("Sales Invoice", invoice_name, "sales_order")
+            if not sales_order:
                 return {
                     "status": "Failed",
                     "message": "No Sales Order linked to this invoice"
                 }
 
-            sales_order = frappe.get_doc("Sales Order", invoice.sales_order)
-            if not sales_order.woocommerce_order_id:
+            woocommerce_order_id = frappe.db.get_value("Sales Order", sales_order, "woocommerce_order_id")
+            if not woocommerce_order_id:
                 return {
                     "status": "Failed",
                     "message": "No WooCommerce order linked to this invoice"
                 }
 
-            response = self.wcapi.get(f"orders/{sales_order.woocommerce_order_id}")
-            if response.status_code != 200:
+            # Revalidate against the last copy seen; an unchanged order comes back as an empty 304
+            etag_key = ORDER_ETAG_CACHE_KEY.format(woocommerce_order_id)
+            cached_order = frappe.cache().get_value(etag_key)
+            response = self.call_with_backoff(
+                self.wcapi.get,
+                ORDER_PATH.format(woocommerce_order_id),
+                params={"_fields": INVOICE_STATUS_FIELDS},
+                headers={"If-None-Match": cached_order["etag"]} if cached_order else None
+            )
+            if response.status_code == 304 and cached_order:
+                order_data = cached_order["order"]
+            elif response.status_code != 200:
                 return {
                     "status": "Failed",
                     "message": f"Failed to fetch WooCommerce order: {response.text}"
                 }
+            else:
+                order_data = orjson.loads(response.content)
+                if response.headers.get("ETag"):
+                    frappe.cache().set_value(
+                        etag_key,
+                        {"etag": response.headers["ETag"], "order": order_data},
+                        expires_in_sec=ORDER_ETAG_TTL
+                    )
 
-            order_data = response.json()
-            is_synced = any(
-                meta["key"] == "erpnext_invoice" and meta["value"] == invoice_name
-                for meta in order_data.get("meta_data", [])
-            )
+            meta_index = {meta["key"]: meta["value"] for meta in order_data.get("meta_data", [])}
+            is_synced = meta_index.get(INVOICE_META_KEY) == invoice_name
 
-            return {
+            result = {
                 "status": "success",
                 "is_synced": is_synced,
-                "woocommerce_order_id": sales_order.woocommerce_order_id,
+                "woocommerce_order_id": woocommerce_order_id,
                 "woocommerce_order_status": order_data.get("status")
             }
+            frappe.cache().set_value(cache_key, result, expires_in_sec=INVOICE_STATUS_TTL)
+            return result
 
         except Exception as e:
             return {
                 "status": "Failed",
                 "message": str(e)
-            }
\ No newline at end of file
+            }
+
+    def get_invoice_sync_status_bulk(self, invoice_names):
+        """
+        Check the WooCommerce sync status of several Sales Invoices at once.
+
+        The linked WooCommerce order ids are resolved with two queries and the
+        orders fetched with `include=` in pages of ORDERS_PER_PAGE, instead of
+        one round trip per invoice.
+
+        Args:
+            invoice_names (list): Names of the ERPNext Sales Invoices to check
+
+        Returns:
+            dict: invoice name -> the same result get_invoice_sync_status returns
+        """
+        try:
+            invoice_orders = self.load_invoice_orders(invoice_names)
+            wc_order_ids = list({order_id for sales_order, order_id in invoice_orders.values() if order_id})
+            wc_orders = {}
+            for start in range(0, len(wc_order_ids), ORDERS_PER_PAGE):
+                response = self.call_with_backoff(self.wcapi.get, "orders", params={
+                    "include": ",".join(wc_order_ids[start:start + ORDERS_PER_PAGE]),
+                    "_fields": f"id,{INVOICE_STATUS_FIELDS}",
+                    "per_page": ORDERS_PER_PAGE
+                })
+                for order_data in self.validate_api_response(response, "fetch invoice sync status"):
+                    wc_orders[str(order_data["id"])] = order_data
+
+            results = {}
+            for invoice_name in invoice_names:
+                sales_order, woocommerce_order_id = invoice_orders.get(invoice_name, (None, None))
+                if not sales_order:
+                    results[invoice_name] = {
+                        "status": "Failed",
+                        "message": "No Sales Order linked to this invoice"
+                    }
+                elif not woocommerce_order_id:
+                    results[invoice_name] = {
+                        "status": "Failed",
+                        "message": "No WooCommerce order linked to this invoice"
+                    }
+                elif woocommerce_order_id not in wc_orders:
+                    results[invoice_name] = {
+                        "status": "Failed",
+                        "message": f"WooCommerce order {woocommerce_order_id} not found"
+                    }
+                else:
+                    order_data = wc_orders[woocommerce_order_id]
+                    meta_index = {meta["key"]: meta["value"] for meta in order_data.get("meta_data", [])}
+                    results[invoice_name] = {
+                        "status": "success",
+                        "is_synced": meta_index.get(INVOICE_META_KEY) == invoice_name,
+                        "woocommerce_order_id": woocommerce_order_id,
+                        "woocommerce_order_status": order_data.get("status")
+                    }
+            return results
+
+        except Exception as e:
+            return {
+                invoice_name: {"status": "Failed", "message": str(e)}
+                for invoice_name in invoice_names
+            }
+
+
+def is_sync_running():
+    """Return True while a run_sync job holds the sync lock"""
+    cache = frappe.cache()
+    return bool(cache.exists(cache.make_key(SYNC_LOCK_KEY)))
+
+
+def run_sync():
+    """
+    Background job entry point for a full WooCommerce to ERPNext order sync.
+
+    Enqueued on the long queue by sync_sales_orders.sync_orders so the sync
+    does not hold a web worker for its whole duration. Only one sync runs at
+    a time: a job that finds the redis lock taken exits without doing work.
+    """
+    cache = frappe.cache()
+    lock_key = cache.make_key(SYNC_LOCK_KEY)
+    if not cache.set(lock_key, 1, nx=True, ex=SYNC_TIMEOUT):
+        WooCommerceLogger.log("Sync", "Warning", "Skipped sync: another WooCommerce sync is already running")
+        return
+
+    try:
+        WooCommerceSync().sync_from_woocommerce()
+    finally:
+        cache.delete(lock_key)
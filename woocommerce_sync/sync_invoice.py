@@ -36,6 +36,32 @@ def sync_invoice(invoice_name):
         return {"status": "Failed", "message": str(e)}
 
 
+@frappe.whitelist()
+def sync_invoices(invoice_names):
+    """
+    Whitelisted API endpoint to sync several Sales Invoices to WooCommerce at once.
+
+    Orders are updated through WooCommerce's orders/batch endpoint, up to 100
+    per request.
+
+    Args:
+        invoice_names (list/str): Names of the Sales Invoices, as a list or JSON array
+
+    Returns:
+        dict: Invoice name -> status dictionary as returned by sync_invoice
+    """
+    invoice_names = frappe.parse_json(invoice_names)
+    try:
+        sync = WooCommerceSync()
+        return sync.sync_invoices_to_woocommerce(invoice_names)
+    except Exception as e:
+        frappe.log_error(f"Error in sync_invoices: {str(e)}", "WooCommerce Sync Error")
+        return {
+            invoice_name: {"status": "Failed", "message": str(e)}
+            for invoice_name in invoice_names
+        }
+
+
 @frappe.whitelist()
 def get_invoice_sync_status(invoice_name):
     """
@@ -55,4 +81,29 @@ def get_invoice_sync_status(invoice_name):
         sync = WooCommerceSync()
         return sync.get_invoice_sync_status(invoice_name)
     except Exception as e:
-        return {"status": "error", "message": str(e)} 
\ No newline at end of file
+        return {"status": "error", "message": str(e)} 
+
+
+@frappe.whitelist()
+def get_invoice_sync_status_bulk(invoice_names):
+    """
+    Whitelisted API endpoint to check the sync status of several Sales Invoices.
+
+    Fetches all linked WooCommerce orders in one request per 100 invoices,
+    so list views do not need a call per invoice.
+
+    Args:
+        invoice_names (list/str): Names of the Sales Invoices, as a list or JSON array
+
+    Returns:
+        dict: Invoice name -> status dictionary as returned by get_invoice_sync_status
+    """
+    invoice_names = frappe.parse_json(invoice_names)
+    try:
+        sync = WooCommerceSync()
+        return sync.get_invoice_sync_status_bulk(invoice_names)
+    except Exception as e:
+        return {
+            invoice_name: {"status": "Failed", "message": str(e)}
+            for invoice_name in invoice_names
+        }
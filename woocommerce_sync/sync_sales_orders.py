@@ -9,27 +9,45 @@ and manage configuration.
 
 import frappe
 from frappe import _
-from woocommerce_sync.sales_order_to_woocommerce import WooCommerceSync
+from woocommerce_sync.sales_order_to_woocommerce import WooCommerceSync, SYNC_TIMEOUT, is_sync_running
 from woocommerce_sync.woocommerce_config import get_woocommerce_config, get_sync_config, update_sync_status
 
 
+# RQ job name of the background order sync; get_job_status only reports on these
+SYNC_JOB_NAME = "WooCommerce Order Sync"
+
+
 @frappe.whitelist()
 def sync_orders():
     """
     Whitelisted API endpoint to manually trigger order synchronization from WooCommerce to ERPNext.
     
     This function:
-    1. Initializes the WooCommerceSync class
-    2. Triggers the sync_from_woocommerce() method
-    3. Returns success/failure status with appropriate messages
+    1. Returns a 'busy' status if a sync is already running
+    2. Initializes the WooCommerceSync class to validate the configuration
+    3. Enqueues run_sync() on the long queue, where sync_from_woocommerce() runs
+    4. Returns success/failure status with appropriate messages
     
     Returns:
-        dict: Status dictionary with 'status' and 'message' keys
+        dict: Status dictionary with 'status' and 'message' keys, plus the
+            background 'job_id' to poll with get_job_status
     """
     try:
-        sync = WooCommerceSync()
-        sync.sync_from_woocommerce()
-        return {"status": "success", "message": "Orders synced from WooCommerce successfully. Check the logs for details."}
+        if is_sync_running():
+            return {"status": "busy", "message": "A WooCommerce sync is already running."}
+
+        WooCommerceSync()
+        job = frappe.enqueue(
+            "woocommerce_sync.sales_order_to_woocommerce.run_sync",
+            queue="long",
+            timeout=SYNC_TIMEOUT,
+            job_name=SYNC_JOB_NAME
+        )
+        return {
+            "status": "success",
+            "message": "Order sync started in the background. Check the logs for details.",
+            "job_id": job.id
+        }
     except Exception as e:
         frappe.log_error(f"Error in sync_orders: {str(e)}", "WooCommerce Sync Error")
         return {"status": "Failed", "message": str(e)}
@@ -49,13 +67,43 @@ def get_sync_status():
         dict: Status dictionary with sync information
     """
     try:
-        sync = WooCommerceSync()
-        return sync.get_sync_status()
+        # Only reads settings, so skip building a client and validating credentials
+        return WooCommerceSync.get_sync_status()
     except Exception as e:
         frappe.log_error(f"Error in get_sync_status: {str(e)}", "WooCommerce Sync Error")
         return {"status": "Failed", "message": str(e)}
 
 
+@frappe.whitelist()
+def get_job_status(job_id):
+    """
+    Whitelisted API endpoint to check on a background sync started by sync_orders.
+    
+    Args:
+        job_id (str): Job id returned by sync_orders
+    
+    Only users who can edit WooCommerce Settings may call this, and only
+    order sync jobs are reported on.
+    
+    Returns:
+        dict: Status dictionary with 'status' and the RQ 'job_status'
+            (queued/started/finished/failed...)
+    """
+    if not frappe.has_permission("WooCommerce Settings", "write"):
+        frappe.throw(_("Not permitted"), frappe.PermissionError)
+
+    try:
+        job = frappe.get_doc("RQ Job", job_id)
+        if job.job_name != SYNC_JOB_NAME:
+            raise frappe.DoesNotExistError
+        return {"status": "success", "job_status": job.status}
+    except frappe.DoesNotExistError:
+        return {"status": "Failed", "message": "Job not found or already expired"}
+    except Exception as e:
+        frappe.log_error(f"Error in get_job_status: {str(e)}", "WooCommerce Sync Error")
+        return {"status": "Failed", "message": str(e)}
+
+
 @frappe.whitelist()
 def update_config(config_data):
     """
@@ -68,7 +116,7 @@ def update_config(config_data):
     - Sync interval (Daily/Weekly/Monthly)
     
     Args:
-        config_data (dict): Configuration data containing:
+        config_data (dict/str): Configuration data, as a dict or JSON string, containing:
             - woocommerce: dict with url, consumer_key, consumer_secret
             - sync: dict with enable_sync (bool) and sync_interval (str)
     
@@ -76,33 +124,31 @@ def update_config(config_data):
         dict: Status dictionary with 'status' and 'message' keys
     """
     try:
-        # Get all WooCommerce Settings documents
-        settings_list = frappe.get_all("WooCommerce Settings", fields=["name"])
-        
-        if not settings_list:
-            # Create default WooCommerce Settings document if none exists
-            from woocommerce_sync.woocommerce_config import create_default_woocommerce_settings
-            create_default_woocommerce_settings()
-            settings_list = frappe.get_all("WooCommerce Settings", fields=["name"])
+        # frappe.call sends object arguments JSON-encoded
+        config_data = frappe.parse_json(config_data)
+
+        # WooCommerce Settings is a Single DocType; get_single always returns it
+        settings = frappe.get_single("WooCommerce Settings")
         
-        # Get the first WooCommerce Settings document
-        settings = frappe.get_doc("WooCommerce Settings", settings_list[0]["name"])
+        updates = {}
         
         # Update WooCommerce API configuration
         woocommerce_config = config_data.get("woocommerce", {})
         if woocommerce_config.get("url"):
-            settings.woocommerce_url = woocommerce_config["url"]
+            updates["woocommerce_url"] = woocommerce_config["url"]
         if woocommerce_config.get("consumer_key"):
-            settings.consumer_key = woocommerce_config["consumer_key"]
+            updates["consumer_key"] = woocommerce_config["consumer_key"]
         if woocommerce_config.get("consumer_secret"):
-            settings.consumer_secret = woocommerce_config["consumer_secret"]
+            updates["consumer_secret"] = woocommerce_config["consumer_secret"]
         
         # Update sync configuration settings
         sync_config = config_data.get("sync", {})
         if "enable_sync" in sync_config:
-            settings.enable_sync = sync_config["enable_sync"]
+            updates["enable_sync"] = sync_config["enable_sync"]
         if sync_config.get("sync_interval"):
-            settings.sync_interval = sync_config["sync_interval"].title()
+            updates["sync_interval"] = sync_config["sync_interval"].title()
+        
+        settings.update(updates)
         
         # Save the document and commit changes
         settings.save()
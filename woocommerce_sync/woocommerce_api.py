@@ -0,0 +1,105 @@
+"""
+WooCommerce Sync - REST API Client
+==================================
+
+This module provides the WooCommerce REST API client used by the sync. It is
+the `woocommerce` package's API class, changed to send every request through
+one persistent requests.Session so connections (and their TLS handshakes) are
+reused across calls instead of being opened per request.
+
+Clients are kept for the lifetime of the worker process by `get_api_client`,
+so successive syncs and API calls share one connection pool.
+"""
+
+import orjson
+import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib.parse import urlencode
+from woocommerce import API
+
+# Connections kept open per host; covers the sync's concurrent page fetches
+POOL_SIZE = 10
+
+
+class WooCommerceAPI(API):
+    """
+    WooCommerce API client backed by a pooled, keep-alive requests.Session.
+
+    The stock client calls `requests.request()` for each call, which creates
+    and discards a session - and its connection pool - every time. This class
+    overrides the client's private request method (name-mangled to
+    `_API__request`) with the same logic, sent through `self.session`.
+
+    Per-request headers may also be passed via a `headers` keyword argument,
+    which the stock client does not allow.
+    """
+    def __init__(self, url, consumer_key, consumer_secret, **kwargs):
+        super().__init__(url, consumer_key, consumer_secret, **kwargs)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "user-agent": self.user_agent,
+            "accept": "application/json"
+        })
+        # No transport-level retries: WooCommerceSync.call_with_backoff owns
+        # retrying connection errors, timeouts and throttling
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _API__request(self, method, endpoint, data, params=None, **kwargs):
+        params = dict(params or {})
+        headers = dict(kwargs.pop("headers", None) or {})
+        url = self._API__get_url(endpoint)
+        auth = None
+
+        if self.is_ssl is True and self.query_string_auth is False:
+            auth = HTTPBasicAuth(self.consumer_key, self.consumer_secret)
+        elif self.is_ssl is True and self.query_string_auth is True:
+            params.update({
+                "consumer_key": self.consumer_key,
+                "consumer_secret": self.consumer_secret
+            })
+        else:
+            encoded_params = urlencode(params)
+            url = f"{url}?{encoded_params}"
+            url = self._API__get_oauth_url(url, method, **kwargs)
+
+        if data is not None:
+            data = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            headers["content-type"] = "application/json;charset=utf-8"
+
+        return self.session.request(
+            method=method,
+            url=url,
+            verify=self.verify_ssl,
+            auth=auth,
+            params=params,
+            data=data,
+            timeout=self.timeout,
+            headers=headers,
+            **kwargs
+        )
+
+
+@lru_cache(maxsize=4)
+def get_api_client(url, consumer_key, consumer_secret, version="wc/v3", verify_ssl=True, timeout=30):
+    """
+    Return the process-wide WooCommerceAPI client for a set of credentials.
+
+    The client is keyed on its arguments, so changing the credentials in
+    WooCommerce Settings simply yields a new client.
+    """
+    return WooCommerceAPI(
+        url=url,
+        consumer_key=consumer_key,
+        consumer_secret=consumer_secret,
+        version=version,
+        verify_ssl=verify_ssl,
+        timeout=timeout
+    )
@@ -6,18 +6,56 @@ This module provides centralized access to WooCommerce configuration settings.
 All configuration is stored in the WooCommerce Settings doctype (Single DocType).
 
 Functions:
+- get_settings(): Returns the raw settings values (cached)
 - get_woocommerce_config(): Retrieves WooCommerce API credentials and settings
 - get_sync_config(): Retrieves synchronization-specific settings
 - update_sync_status(): Updates sync status and timestamp
+- clear_settings_cache(): Drops the cached settings after they change
+
+The settings are read on every sync and API call but rarely change, so they
+are cached in redis and invalidated whenever the Single document is saved.
 """
 
 import frappe
 
 
+SETTINGS_CACHE_KEY = "woocommerce_sync:settings"
+
+# Upper bound on how long a stale copy can survive a missed invalidation (seconds)
+SETTINGS_CACHE_TTL = 300
+
+
 # ----------------------------
 # Core Config Access
 # ----------------------------
 
+def get_settings():
+    """
+    Return the WooCommerce Settings values, cached in redis.
+
+    Returns:
+        dict: Field values of the WooCommerce Settings Single DocType
+    """
+    settings = frappe.cache().get_value(SETTINGS_CACHE_KEY)
+    if settings is None:
+        settings = frappe.db.get_singles_dict("WooCommerce Settings")
+        frappe.cache().set_value(SETTINGS_CACHE_KEY, settings, expires_in_sec=SETTINGS_CACHE_TTL)
+    return settings
+
+
+def clear_settings_cache(doc=None, method=None):
+    """
+    Invalidate the cached WooCommerce Settings.
+
+    Hooked to WooCommerce Settings `on_update`; the arguments are the ones
+    passed by doc_events and are not used. The key is dropped again once the
+    transaction commits, so a read made before the commit cannot leave the
+    old values cached.
+    """
+    frappe.cache().delete_value(SETTINGS_CACHE_KEY)
+    frappe.db.after_commit.add(lambda: frappe.cache().delete_value(SETTINGS_CACHE_KEY))
+
+
 def get_woocommerce_config():
     """
     Retrieve WooCommerce API configuration from WooCommerce Settings doctype.
@@ -37,7 +75,7 @@ def get_woocommerce_config():
         Returns default values if configuration cannot be retrieved or is incomplete.
     """
     try:
-        config = frappe.db.get_singles_dict("WooCommerce Settings")
+        config = get_settings()
         return {
             "url": config.get("woocommerce_url") or "",
             "consumer_key": config.get("consumer_key") or "",
@@ -65,6 +103,8 @@ def get_sync_config():
     Returns a dictionary containing:
     - enable_sync: Boolean flag indicating if sync is enabled
     - sync_interval: Sync interval setting (daily/weekly/monthly)
+    - debug_log: Boolean flag enabling step-by-step order logs
+    - log_level: Lowest level written to the sync log (Info/Warning/Error)
     - sync_status: Current sync status (Success/Failed/Partial Success)
     - last_sync: Timestamp of last synchronization
     
@@ -75,10 +115,12 @@ def get_sync_config():
         Returns default values if configuration cannot be retrieved.
     """
     try:
-        config = frappe.db.get_singles_dict("WooCommerce Settings")
+        config = get_settings()
         return {
             "enable_sync": bool(config.get("enable_sync")),
             "sync_interval": (config.get("sync_interval") or "Daily").lower(),
+            "debug_log": bool(config.get("debug_log")),
+            "log_level": config.get("log_level") or "Info",
             "sync_status": config.get("sync_status") or "",
             "last_sync": config.get("last_sync"),
         }
@@ -87,6 +129,8 @@ def get_sync_config():
         return {
             "enable_sync": False,
             "sync_interval": "daily",
+            "debug_log": False,
+            "log_level": "Info",
             "sync_status": "",
             "last_sync": None,
         }
@@ -108,10 +152,14 @@ def update_sync_status(last_sync=None, sync_status=None):
         Both parameters are optional. Only provided parameters will be updated.
     """
     try:
+        updates = {}
         if last_sync is not None:
-            frappe.db.set_single_value("WooCommerce Settings", "last_sync", last_sync)
+            updates["last_sync"] = last_sync
         if sync_status is not None:
-            frappe.db.set_single_value("WooCommerce Settings", "sync_status", sync_status)
+            updates["sync_status"] = sync_status
+        if updates:
+            frappe.db.set_single_value("WooCommerce Settings", updates)
+            clear_settings_cache()
     except Exception as e:
         frappe.log_error(f"Error updating sync status: {str(e)}", "WooCommerce Config Error")
 
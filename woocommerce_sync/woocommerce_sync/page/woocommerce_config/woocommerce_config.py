@@ -1,5 +1,6 @@
 import frappe
 from woocommerce import API
+from woocommerce_sync.woocommerce_config import clear_settings_cache
 
 # This must be a Single DocType you create (e.g., "WooCommerce Sync Settings")
 CONFIG_KEY = "WooCommerce Settings"
@@ -24,6 +25,7 @@ def save_config(config):
 
     for key, value in config.items():
         frappe.db.set_single_value(CONFIG_KEY, key, value)
+    clear_settings_cache()
 
     return "✅ Configuration saved successfully!"
 
@@ -39,7 +41,7 @@ def test_connection():
             consumer_secret=cfg.get("consumer_secret"),
             version="wc/v3"
         )
-        response = wcapi.get("products")
+        response = wcapi.get("products", params={"per_page": 1, "_fields": "id"})
         if response.status_code == 200:
             return "✅ Connection successful!"
         return f"❌ Failed: {response.text}"
@@ -51,4 +53,5 @@ def test_connection():
 def sync_now():
     """Start a manual sync"""
     frappe.db.set_single_value(CONFIG_KEY, "sync_status", "Running")
+    clear_settings_cache()
     return "🔄 Sync started..."